@@ -16,17 +16,20 @@ class Config:
     sheet_key: str
     project_path: str
     mode: Mode
+    verbose: bool
 
     def __init__(self,
                  creds_path: str,
                  sheet_key: str,
                  project_path: str,
                  mode: Mode,
+                 verbose: bool = False,
                  ):
         self.creds_path = creds_path
         self.sheet_key = sheet_key
         self.project_path = project_path
         self.mode = mode
+        self.verbose = verbose
 
 
 def init_config() -> Config:
@@ -53,6 +56,11 @@ def init_config() -> Config:
         default="pull",
         help="Operation mode: init (initialize sheet from ARB files), push (push new values from ARB files to sheet), pull (update ARB files from sheet, default), diff (show differences between local ARB files and sheet)",
     )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Print diagnostic details such as the resolved l10n.yaml and ARB directory paths.",
+    )
     args = parser.parse_args()
 
     creds_path = args.creds or os.getenv("GOOGLE_CREDS_PATH")
@@ -81,4 +89,4 @@ def init_config() -> Config:
     if not os.path.isdir(project_path):
         raise FileNotFoundError("Project path does not exist.")
 
-    return Config(creds_path, sheet_key, project_path, mode)
+    return Config(creds_path, sheet_key, project_path, mode, args.verbose)
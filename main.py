@@ -1,12 +1,39 @@
+import io
 import os
 import sys
 import json
-from typing import Optional
+import logging
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import BinaryIO, Callable, Iterable, Optional, Sequence
 import gspread
+from gspread.utils import InsertDataOption, ValueInputOption, absolute_range_name
+from gspread.spreadsheet import Spreadsheet
 from gspread.worksheet import Worksheet
 import yaml
 import config as cfg
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, only used when orjson is missing
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Buffer size used when writing ARB files.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# ARB file name, capturing the language code: app_en.arb, app_en_US.arb, ...
+_APP_ARB = re.compile(r"app_([A-Za-z0-9_-]+)\.arb")
+
 
 class _Colors:
     def __init__(self):
@@ -24,12 +51,22 @@ class _Colors:
             self.CYAN = self.BOLD = self.DIM = self.RESET = ""
 
 
+# Prefer the libyaml-backed loader, fall back to the pure Python one.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def arb_files_dir(config_path: str) -> str:
     """
     Read l10n.yaml to get the 'arb-dir' entry.
     """
+    # The parse is cached per file modification time, so edits are picked up.
+    return _read_arb_files_dir(config_path, os.stat(config_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _read_arb_files_dir(config_path: str, mtime_ns: int) -> str:
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
     arb_dir = config.get("arb-dir")
     if not arb_dir:
         raise ValueError("arb-dir not found in the l10n configuration.")
@@ -43,6 +80,112 @@ def find_l10n_config(project_path: str) -> Optional[str]:
     return config_path if os.path.isfile(config_path) else None
 
 
+def _load_arb(path: str) -> dict:
+    """Read and decode a single ARB file."""
+    with open(path, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def _split_arb(path: str) -> tuple[dict[str, str], set[str]]:
+    """
+    Read an ARB file into (translations, metadata_keys).
+
+    orjson decodes the whole file fastest and is preferred. Without it but
+    with ijson installed, the file is streamed key by key so "@" metadata
+    values are dropped as soon as they are parsed.
+    """
+    translations = {}
+    metadata_keys = set()
+    if orjson is None and ijson is not None:
+        with open(path, "rb") as f:
+            for key, value in ijson.kvitems(f, ""):
+                if key.startswith("@"):
+                    metadata_keys.add(key)
+                else:
+                    translations[key] = value
+        return translations, metadata_keys
+
+    for key, value in _load_arb(path).items():
+        if key.startswith("@"):
+            metadata_keys.add(key)
+        else:
+            translations[key] = value
+    return translations, metadata_keys
+
+
+def _write_arb(path: str, arb_data: dict) -> str:
+    """
+    Write ARB data to path atomically: the content goes to a temporary file
+    in the same directory which is then renamed over the target, so an
+    interrupted write never leaves a truncated ARB file behind.
+    Symlinks are followed. Returns the directory the file was written to.
+    """
+    path = os.path.realpath(path)
+    directory, filename = os.path.split(path)
+    try:
+        existing_mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        existing_mode = None
+    tmp_path = os.path.join(directory, f".{filename}.{uuid.uuid4().hex}.tmp")
+    # Like open(), mode 0o666 leaves the permissions of new files to the umask.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o666)
+    try:
+        try:
+            # A large buffer lets typical ARB files go out in a single write.
+            f = os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE)
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            _dump_arb(arb_data, f)
+            # Persist the data before the rename so the new name never points
+            # at a file whose content was lost in a power failure.
+            f.flush()
+            os.fsync(f.fileno())
+        if existing_mode is not None:
+            os.chmod(tmp_path, existing_mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return directory
+
+
+def _fsync_dir(directory: str):
+    """Flush directory entries (e.g. renames) to disk where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Directories cannot be opened for fsync on Windows
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _dump_arb(arb_data: dict, f: BinaryIO):
+    """Write ARB data to a binary file as UTF-8 JSON indented with two spaces."""
+    if orjson is not None:
+        f.write(orjson.dumps(arb_data, option=orjson.OPT_INDENT_2))
+        return
+    # Stream the encoder output instead of building the whole document first.
+    text = io.TextIOWrapper(f, encoding="utf-8")
+    json.dump(arb_data, text, ensure_ascii=False, indent=2)
+    text.detach()  # flushes pending text and leaves f open
+
+
+def fetch_ranges(spreadsheet: Spreadsheet, ranges: list[str]) -> list[list[list[str]]]:
+    """
+    Fetch several ranges with a single values.batchGet request.
+    Returns the values of each range, in the order the ranges were given.
+    Empty ranges yield an empty list.
+    """
+    response = spreadsheet.values_batch_get(ranges=ranges)
+    return [value_range.get("values", []) for value_range in response["valueRanges"]]
+
+
 def sync_localizations(sheet: Worksheet, localization_dir: str):
     """
     Update ARB files in localization_dir with data from the sheet.
@@ -52,31 +195,68 @@ def sync_localizations(sheet: Worksheet, localization_dir: str):
       { id: { language_code: translation, ... } }
     and then updates (or creates) ARB files named app_<language_code>.arb.
     """
-    all_values = sheet.get_all_values()
+    all_values = fetch_ranges(sheet.spreadsheet, [absolute_range_name(sheet.title)])[0]
     sheet_dict = parse_sheet_to_dict(all_values)
 
     header = all_values[0]
     language_codes = [col.strip() for col in header[1:]]
 
+    written_dirs = set()
     for lang in language_codes:
         arb_filename = f"app_{lang}.arb"
         arb_filepath = os.path.join(localization_dir, arb_filename)
+        arb_exists = os.path.isfile(arb_filepath)
         arb_data = {}
-        if os.path.isfile(arb_filepath):
-            with open(arb_filepath, "r", encoding="utf-8") as f:
-                arb_data = json.load(f)
+        if arb_exists:
+            arb_data = _load_arb(arb_filepath)
 
+        # Merge into a copy so unchanged files are left untouched on disk.
+        new_arb = {**arb_data}
         updated_keys = 0
         for trans_id, translations in sheet_dict.items():
-            if lang in translations:
-                arb_data[trans_id] = translations[lang]
+            if lang in translations and new_arb.get(trans_id) != translations[lang]:
+                new_arb[trans_id] = translations[lang]
                 updated_keys += 1
 
-        with open(arb_filepath, "w", encoding="utf-8") as f:
-            json_str = json.dumps(arb_data, ensure_ascii=False, indent=2)
-            f.write(json_str)
+        if arb_exists and new_arb == arb_data:
+            print(f"No changes in {arb_filename}.")
+            continue
+
+        written_dirs.add(_write_arb(arb_filepath, new_arb))
         print(f"Updated {updated_keys} keys in {arb_filename}.")
 
+    # File contents are already synced; persist the renames once per directory.
+    for directory in written_dirs:
+        _fsync_dir(directory)
+
+
+# The hot per-cell loops in parse_sheet_to_dict and _build_rows inline the
+# escaping instead, to avoid a Python-level call per cell.
+def _escape_nl(value: str) -> str:
+    """Escape newlines as a literal \\n for storing in the sheet."""
+    return value.replace("\n", "\\n")
+
+
+@lru_cache(maxsize=16)
+def _lang_cells_getter(ncols: int) -> Callable[[list[str]], Sequence[str]]:
+    """
+    Return a function extracting the ncols language cells that follow the
+    id column of a sheet row. Short rows are padded with empty strings.
+    """
+    # Fetches all language cells of a full-width row in one C-level call.
+    # itemgetter with a single index returns a bare value, hence the guard.
+    get_full_row = itemgetter(*range(1, ncols + 1)) if ncols > 1 else None
+
+    def get_lang_cells(row: list[str]) -> Sequence[str]:
+        if get_full_row is not None and len(row) > ncols:
+            return get_full_row(row)
+        cells = row[1:1 + ncols]
+        if len(cells) < ncols:
+            cells.extend([""] * (ncols - len(cells)))
+        return cells
+
+    return get_lang_cells
+
 
 def parse_sheet_to_dict(sheet_values: list[list[str]]) -> dict[str, dict[str, str]]:
     """
@@ -95,35 +275,57 @@ def parse_sheet_to_dict(sheet_values: list[list[str]]) -> dict[str, dict[str, st
     if header[0].strip().lower() != "id":
         raise ValueError("The first header column must be 'id'.")
 
+    # Language codes are stripped once instead of once per row.
+    lang_codes = tuple(h.strip() for h in header[1:])
+    ncols = len(lang_codes)
+    get_lang_cells = _lang_cells_getter(ncols)
+
     translations_dict = {}
     for row in sheet_values[1:]:
         # Skip empty rows
         if not row or not row[0].strip():
             continue
         id_key = row[0].strip()
-        # Create a dict for this id with language code -> translation.
-        # We'll iterate over the rest of the columns.
-        lang_translations = {}
-        missing_translations = []
-        for i in range(1, len(header)):
-            lang_code = header[i].strip()
-            # If the row doesn't have a value for this column, default to an empty string.
-            if i >= len(row) or len(row[i]) == 0:
-                missing_translations.append(lang_code)
-                continue
-            value = row[i]
-            lang_translations[lang_code] = value.replace("\\n", "\n")
+        vals = [value.replace("\\n", "\n") for value in get_lang_cells(row)]
+        # Empty cells are reported as missing rather than stored.
+        lang_translations = {
+            lang_code: value for lang_code, value in zip(lang_codes, vals) if value
+        }
         translations_dict[id_key] = lang_translations
-        if len(missing_translations) > 0:
-            print(f"Missing translations for {id_key}: {missing_translations}")
+        # Only rescan the row when some language is actually missing.
+        if len(lang_translations) < ncols:
+            missing_translations = [
+                lang_code for lang_code, value in zip(lang_codes, vals) if not value
+            ]
+            if len(missing_translations) > 0:
+                print(f"Missing translations for {id_key}: {missing_translations}")
 
     return translations_dict
 
 
+def _build_rows(
+    localizations: dict[str, dict[str, str]],
+    lang_codes: list[str],
+    ids: Iterable[str],
+) -> list[list[str]]:
+    """
+    Build sheet rows [id, translation, ...] for the given ids, one cell per
+    language in lang_codes. Missing translations become empty cells and
+    newlines are escaped as \\n to avoid newlines in the sheet.
+    """
+    rows = []
+    for str_id in ids:
+        translations = localizations[str_id]
+        rows.append([str_id] + [
+            translations.get(lang, "").replace("\n", "\\n") for lang in lang_codes
+        ])
+    return rows
+
+
 def push_values_to_sheet(sheet, localizations: dict[str, dict[str, str]]):
     """
     Update the sheet with only the actual differences from the localizations dictionary.
-    Changed cells are updated individually via batch_update, new entries are appended.
+    Changed cells are written in a single batch request, new entries are appended.
     Unchanged data is not touched, keeping Google Sheets version history clean.
     """
     existing_data = sheet.get_all_values()
@@ -134,13 +336,10 @@ def push_values_to_sheet(sheet, localizations: dict[str, dict[str, str]]):
             lang_codes.update(translations.keys())
         lang_codes = sorted(lang_codes)
         header = ["id"] + lang_codes
-        rows = [header]
-        for str_id, translations in localizations.items():
-            row = [str_id]
-            for lang in lang_codes:
-                row.append(translations.get(lang, "").replace("\n", "\\n"))
-            rows.append(row)
-        sheet.update("A1", rows)
+        rows = [header] + _build_rows(localizations, lang_codes, localizations)
+        sheet.update(
+            range_name="A1", values=rows, value_input_option=ValueInputOption.raw
+        )
         sheet.resize(rows=len(rows), cols=len(rows[0]))
         print(f"Initialized sheet with {len(rows) - 1} translation entries.")
         return
@@ -155,45 +354,56 @@ def push_values_to_sheet(sheet, localizations: dict[str, dict[str, str]]):
         if row and row[0].strip():
             row_index[row[0].strip()] = i
 
-    # Find changed cells in existing rows
+    # Find changed cells in existing rows and new keys in a single pass,
+    # looking each id up in the sheet only once.
     cells_to_update = []
     updated_keys = set()
-    for str_id, translations in localizations.items():
-        if str_id in existing_dict:
-            row_num = row_index[str_id]
-            for j, lang in enumerate(lang_codes):
-                col_num = j + 2  # column 1 is id, columns 2+ are languages
-                local_val = translations.get(lang)
-                existing_val = existing_dict[str_id].get(lang)
-
-                if local_val is None:
-                    continue  # Don't clear existing translations
-                if local_val != existing_val:
-                    cell_ref = gspread.utils.rowcol_to_a1(row_num, col_num)
-                    cells_to_update.append({
-                        "range": cell_ref,
-                        "values": [[local_val.replace("\n", "\\n")]],
-                    })
-                    updated_keys.add(str_id)
-
-    # Find new keys and build rows to append
-    new_rows = []
     new_ids = []
     for str_id, translations in localizations.items():
-        if str_id not in existing_dict:
-            row = [str_id]
-            for lang in lang_codes:
-                row.append(translations.get(lang, "").replace("\n", "\\n"))
-            new_rows.append(row)
+        existing_translations = existing_dict.get(str_id)
+        if existing_translations is None:
             new_ids.append(str_id)
+            continue
+        row_num = row_index[str_id]
+        for j, lang in enumerate(lang_codes):
+            col_num = j + 2  # column 1 is id, columns 2+ are languages
+            local_val = translations.get(lang)
+            existing_val = existing_translations.get(lang)
+
+            if local_val is None:
+                continue  # Don't clear existing translations
+            if local_val != existing_val:
+                cell_ref = gspread.utils.rowcol_to_a1(row_num, col_num)
+                cells_to_update.append({
+                    "range": absolute_range_name(sheet.title, cell_ref),
+                    "values": [[_escape_nl(local_val)]],
+                })
+                updated_keys.add(str_id)
+
+    # Build rows to append for the new keys
+    new_rows = _build_rows(localizations, lang_codes, new_ids)
+
+    if cells_to_update:
+        # Apply all cell edits in a single values.batchUpdate request.
+        sheet.spreadsheet.values_batch_update({
+            "valueInputOption": ValueInputOption.raw,
+            "data": cells_to_update,
+        })
+
+    if new_rows:
+        # Only the new rows are sent and the server inserts them after the
+        # table, growing the grid as needed, so rows added to the sheet since
+        # it was read are not overwritten.
+        sheet.append_rows(
+            new_rows,
+            value_input_option=ValueInputOption.raw,
+            insert_data_option=InsertDataOption.insert_rows,
+        )
 
-    # Apply only the actual changes
     if cells_to_update:
-        sheet.batch_update(cells_to_update)
         print(f"Updated {len(updated_keys)} existing entries ({len(cells_to_update)} cells).")
 
     if new_rows:
-        sheet.append_rows(new_rows)
         print(f"Added {len(new_rows)} new translation entries.")
         print(f"New IDs added: \n\t{'\n\t'.join(sorted(new_ids))}")
 
@@ -215,24 +425,31 @@ def gather_localizations_from_arbs(
     localizations = {}
     metadata_keys = set()
 
-    for filename in os.listdir(arbs_dir):
-        if filename.startswith("app_") and filename.endswith(".arb"):
+    language_codes = []
+    file_paths = []
+    with os.scandir(arbs_dir) as entries:
+        for entry in entries:
             # Extract language code from filename. Example: app_en.arb -> "en"
-            parts = filename.split("_")
-            if len(parts) < 2:
+            match = _APP_ARB.fullmatch(entry.name)
+            if not match or not entry.is_file():
                 continue
-            lang_part = parts[1]
-            language_code = lang_part.split(".")[0]
-            file_path = os.path.join(arbs_dir, filename)
-            with open(file_path, "r", encoding="utf-8") as f:
-                arb_data = json.load(f)
-            for key, value in arb_data.items():
-                if key.startswith("@"):
-                    metadata_keys.add(key)
-                else:
-                    if key not in localizations:
-                        localizations[key] = {}
-                    localizations[key][language_code] = value
+            language_codes.append(match.group(1))
+            file_paths.append(entry.path)
+
+    if not file_paths:
+        return localizations, metadata_keys
+
+    # Reading is I/O bound, so load the files concurrently and merge the
+    # results here, in directory order.
+    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+        arb_contents = list(executor.map(_split_arb, file_paths))
+
+    for language_code, (translations, arb_metadata) in zip(language_codes, arb_contents):
+        metadata_keys.update(arb_metadata)
+        for key, value in translations.items():
+            if key not in localizations:
+                localizations[key] = {}
+            localizations[key][language_code] = value
     return localizations, metadata_keys
 
 
@@ -248,21 +465,12 @@ def fill_sheet_from_localizations(sheet, localizations: dict[str, dict[str, str]
         lang_codes.update(translations.keys())
     lang_codes = sorted(lang_codes)
 
-    # Prepare header row
+    # Prepare header row followed by one row per id
     header = ["id"] + lang_codes
-    rows = [header]
-
-    # Prepare each row
-    for str_id in localizations.keys():
-        row = [str_id]
-        for lang in lang_codes:
-            # replace \n with \\n to avoid newlines in the sheet
-            row.append(localizations[str_id].get(
-                lang, "").replace("\n", "\\n"))
-        rows.append(row)
+    rows = [header] + _build_rows(localizations, lang_codes, localizations)
 
     # Update the sheet with new data (write first, then trim excess to prevent data loss)
-    sheet.update(rows, "A1")
+    sheet.update(range_name="A1", values=rows, value_input_option=ValueInputOption.raw)
     sheet.resize(rows=len(rows), cols=len(rows[0]))
     print(f"Sheet updated with {len(rows)-1} translation entries.")
 
@@ -353,8 +561,8 @@ def diff_localizations(sheet: Worksheet, localization_dir: str) -> int:
         for key in sorted(changed.keys()):
             print(f"  {c.BOLD}{key}{c.RESET}")
             for lang, (local_val, sheet_val) in sorted(changed[key].items()):
-                local_display = local_val.replace("\n", "\\n")
-                sheet_display = sheet_val.replace("\n", "\\n")
+                local_display = _escape_nl(local_val)
+                sheet_display = _escape_nl(sheet_val)
                 print(f"    {lang}: {c.GREEN}\"{local_display}\"{c.RESET} -> {c.RED}\"{sheet_display}\"{c.RESET}")
 
     if missing:
@@ -373,6 +581,10 @@ def diff_localizations(sheet: Worksheet, localization_dir: str) -> int:
 
 def main():
     config = cfg.init_config()
+    logging.basicConfig(
+        level=logging.DEBUG if config.verbose else logging.WARNING,
+        format="%(message)s",
+    )
 
     # Set up credentials using the provided service account JSON file
     client = gspread.auth.service_account(filename=config.creds_path)
@@ -384,9 +596,8 @@ def main():
     if not l10_config:
         raise FileNotFoundError("Could not find l10n.yaml in the project directory.")
     localizations_dir = arb_files_dir(l10_config)
-    # print localizations_dir and config
-    print("localizations_dir: ", localizations_dir)
-    print("config: ", l10_config)
+    logger.debug("localizations_dir: %s", localizations_dir)
+    logger.debug("config: %s", l10_config)
 
     if config.mode == cfg.Mode.INIT:
         # Gather localizations from ARB files